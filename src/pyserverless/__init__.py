@@ -57,6 +57,18 @@ Like the query method, the transaction method also accepts options:
 ...     )
 ... )
 
+Batch queries into a single request with a pipeline:
+
+>>> with neon.pipeline() as pipe:
+...     pipe.query("INSERT INTO users (name) VALUES ($1)", ("John",))
+...     pipe.query("SELECT * FROM users")
+>>> results = pipe.results
+
+Prepare a query that is executed repeatedly:
+
+>>> get_user = neon.prepare("SELECT * FROM users WHERE id = $1")
+>>> results = get_user(1)
+
 """
 
 from pyserverless.models import (
@@ -65,11 +77,18 @@ from pyserverless.models import (
     NeonTransactionOptions,
 )
 from pyserverless.neon import Neon, NeonAsync
+from pyserverless.pipeline import NeonAsyncBatcher, NeonAsyncPipeline, NeonPipeline
+from pyserverless.prepared import NeonAsyncPreparedQuery, NeonPreparedQuery
 
 __all__ = [
     "HTTPQueryOptions",
     "IsolationLevel",
     "Neon",
     "NeonAsync",
+    "NeonAsyncBatcher",
+    "NeonAsyncPipeline",
+    "NeonAsyncPreparedQuery",
+    "NeonPipeline",
+    "NeonPreparedQuery",
     "NeonTransactionOptions",
 ]
@@ -0,0 +1,93 @@
+"""
+JSON encoding and decoding for the Neon HTTP protocol.
+
+Uses orjson when it is installed (`pip install pyserverless[orjson]`),
+and falls back to the standard library otherwise. Both paths encode to
+and decode from bytes, so callers don't need to care which one is active.
+
+`loads` decodes the protocol's own messages, `loads_value` decodes json
+and jsonb column values, which must come back exactly as the standard
+library would decode them.
+"""
+
+import json
+import math
+import re
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Encode to compact UTF-8 JSON, the same output httpx produces for `json=`."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[bytes | str], Any]
+loads_value: Callable[[bytes | str], Any]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the optional dependency is missing
+    dumps = _stdlib_dumps
+    loads = json.loads
+    loads_value = json.loads
+else:
+    # orjson decodes integers beyond 64 bits as floats, losing digits. They take at least 19 digits to write
+    _LONG_DIGITS = re.compile(r"\d{19}")
+
+    def _orjson_loads_value(value: bytes | str) -> Any:
+        """Decode with orjson, unless it could lose precision on a large integer or rejects what the stdlib accepts."""
+        if isinstance(value, bytes):
+            # the elements of json arrays come through psycopg's loader as bytes
+            value = value.decode()
+        if _LONG_DIGITS.search(value) is None:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(value)
+
+    # values orjson would encode that the standard library rejects are passed to `_reject` instead
+    _DUMPS_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def _reject(obj: Any) -> Any:
+        """Refuse a value orjson only encodes through its options, so the standard library decides on it."""
+        msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+        raise TypeError(msg)
+
+    def _stdlib_rejects(obj: Any) -> bool:
+        """
+        Whether obj holds a value orjson always encodes but the standard library rejects.
+
+        Those are NaN and infinite floats, which orjson encodes as null, UUIDs, and enums that
+        aren't also ints, floats or strings.
+        """
+        if isinstance(obj, float):
+            return not math.isfinite(obj)
+        if isinstance(obj, dict):
+            return any(map(_stdlib_rejects, obj.values()))
+        if isinstance(obj, list | tuple):
+            return any(map(_stdlib_rejects, obj))
+        return isinstance(obj, UUID) or (isinstance(obj, Enum) and not isinstance(obj, int | float | str))
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        """Encode with orjson, leaving to the standard library what it alone would accept or reject."""
+        try:
+            encoded = orjson.dumps(obj, option=_DUMPS_OPTIONS, default=_reject)
+        except TypeError:
+            # non-str dict keys, integers beyond 64 bits, str and int subclasses, dates and dataclasses,
+            # which the standard library encodes, or rejects, like it always did
+            return _stdlib_dumps(obj)
+        if _stdlib_rejects(obj):
+            # raises the same error the standard library always did
+            return _stdlib_dumps(obj)
+        return encoded
+
+    dumps = _orjson_dumps
+    loads = orjson.loads
+    loads_value = _orjson_loads_value
@@ -1,20 +1,25 @@
 """Data models for Neon database client."""
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any
+from __future__ import annotations
 
-from pyserverless.errors import TransactionConfigurationError
+from collections.abc import Callable, Mapping  # noqa: TC003 - resolved by typing.get_type_hints at runtime
+from dataclasses import dataclass
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any
 
 # A FieldDef represents metadata for a column
 FieldDef = dict[str, Any]
 
-# QueryRows is either a list of tuples (when arrayMode is True) or a list of dicts (when False)
-QueryRows = list[list[Any]] | list[dict[str, Any]]
+# QueryRows is either a list of tuples (when arrayMode is True), a list of dicts (when False),
+# or a dict of column name to column values (when columnar is True)
+QueryRows = list[list[Any]] | list[dict[str, Any]] | dict[str, list[Any]]
 
+# Shared read-only default so options objects don't allocate a new dict each time
+_EMPTY_FETCH_OPTIONS: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FullQueryResults:
     """
     Results of query with fullResults set to True.
@@ -22,7 +27,7 @@ class FullQueryResults:
     Parameters
     ----------
     rows : QueryRows
-        The actual query results, either as arrays or objects.
+        The actual query results, either as arrays, objects, or columns.
     fields : list[FieldDef]
         Metadata about the columns in the results.
     rowCount : int
@@ -43,7 +48,7 @@ class FullQueryResults:
 
 
 # Postgres transaction isolation level: see https://www.postgresql.org/docs/current/transaction-iso.html
-class IsolationLevel(Enum):
+class IsolationLevel(StrEnum):
     """
     Postgres transaction isolation level.
 
@@ -64,6 +69,7 @@ class IsolationLevel(Enum):
     -----
     - READ_UNCOMMITTED is actually just READ_COMMITTED in Postgres since
       dirty reads are not supported.
+    - Members are strings, so they can be sent as header values directly.
 
     """
 
@@ -73,7 +79,7 @@ class IsolationLevel(Enum):
     SERIALIZABLE = "Serializable"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HTTPQueryOptions:
     """
     Options for HTTP query execution.
@@ -82,10 +88,15 @@ class HTTPQueryOptions:
     ----------
     array_mode : bool, default=False
         Whether to return results as arrays or objects.
+    columnar : bool, default=False
+        Whether to return results as a dict of column name to column values
+        instead of one array or object per row. Takes precedence over array_mode.
     full_results : bool, default=False
         Whether to return full result metadata.
-    fetch_options : dict[str, Any], default={}
-        Options to pass to httpx.Client.
+    fetch_options : Mapping[str, Any], default={}
+        Options for the HTTP request. Per-request options (timeout, auth, follow_redirects,
+        extensions) are sent with the request; any other option selects a pooled httpx.Client
+        built with those options, or a dedicated one if an option value isn't a str, number, None or tuple.
     auth_token : Callable[[], str] | None, default=None
         Function that returns an auth token.
     query_callback : Callable[[ParameterizedQuery], None] | None, default=None
@@ -96,8 +107,9 @@ class HTTPQueryOptions:
     """
 
     array_mode: bool = False
+    columnar: bool = False
     full_results: bool = False
-    fetch_options: dict[str, Any] = field(default_factory=dict)
+    fetch_options: Mapping[str, Any] = _EMPTY_FETCH_OPTIONS
     auth_token: Callable[[], str] | None = None
     query_callback: Callable[[str, list[Any]], None] | None = None
     result_callback: (
@@ -109,7 +121,7 @@ class HTTPQueryOptions:
     ) = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeonTransactionOptions(HTTPQueryOptions):
     """
     Options for transaction execution.
@@ -125,10 +137,14 @@ class NeonTransactionOptions(HTTPQueryOptions):
         is SERIALIZABLE and read_only is True.
     array_mode : bool, default=False
         Whether to return results as arrays.
+    columnar : bool, default=False
+        Whether to return results as a dict of column name to column values.
     full_results : bool, default=False
         Whether to return full result metadata.
-    fetch_options : dict[str, Any], default={}
-        Options to pass to httpx.Client.
+    fetch_options : Mapping[str, Any], default={}
+        Options for the HTTP request. Per-request options (timeout, auth, follow_redirects,
+        extensions) are sent with the request; any other option selects a pooled httpx.Client
+        built with those options, or a dedicated one if an option value isn't a str, number, None or tuple.
     auth_token : Callable[[], str] | None, default=None
         Function that returns an auth token.
     query_callback : Callable[[ParameterizedQuery], None] | None, default=None
@@ -144,9 +160,13 @@ class NeonTransactionOptions(HTTPQueryOptions):
 
     def __post_init__(self) -> None:
         """Validate transaction configuration."""
-        deferable_requirements = self.isolation_level == IsolationLevel.SERIALIZABLE and self.read_only
-        if self.deferrable and not deferable_requirements:
+        if not self.deferrable:
+            return
+        if self.isolation_level != IsolationLevel.SERIALIZABLE or not self.read_only:
+            # imported here since errors are only needed on the failure path
+            from pyserverless.errors import TransactionConfigurationError
+
             raise TransactionConfigurationError(
-                self.isolation_level.value,
+                self.isolation_level,
                 self.read_only,
             )
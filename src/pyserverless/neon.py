@@ -1,32 +1,60 @@
 """Serverless client for Neon database queries over HTTP."""
 
+import asyncio
+import importlib.util
 import os
-from typing import Any
-from urllib.parse import urlparse
+import re
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import replace
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from ipaddress import (
+    IPv4Address,
+    IPv4Interface,
+    IPv4Network,
+    IPv6Address,
+    IPv6Interface,
+    IPv6Network,
+    ip_address,
+    ip_interface,
+    ip_network,
+)
+from operator import attrgetter
+from socket import inet_aton
+from types import TracebackType
+from typing import Any, Final, Self
+from uuid import UUID
 
 import httpx
 import psycopg.types.datetime as psycopg_datetime
-from psycopg import Error as PsycopgError
-from psycopg.adapt import PyFormat, Transformer
-from psycopg.postgres import register_default_adapters, register_default_types, types
+from psycopg import Error as PsycopgError, sql
+from psycopg.abc import Loader
+from psycopg.adapt import AdaptersMap, PyFormat, Transformer
+from psycopg.postgres import adapters, register_default_adapters, types
 from psycopg.pq import Format
-from psycopg.types.json import Jsonb
+from psycopg.types.json import JsonbLoader, JsonLoader, set_json_dumps, set_json_loads
 
+from pyserverless import _json
 from pyserverless.errors import (
     ConnectionStringFormattingError,
     ConnectionStringMissingError,
     InvalidAuthTokenError,
     NeonHTTPClientError,
     NeonHTTPResponseError,
+    NeonPyServerlessError,
     PostgresAdaptationError,
     PythonAdaptationError,
 )
 from pyserverless.models import (
     FullQueryResults,
     HTTPQueryOptions,
+    IsolationLevel,
     NeonTransactionOptions,
     QueryRows,
 )
+from pyserverless.pipeline import NeonAsyncBatcher, NeonAsyncPipeline, NeonPipeline
+from pyserverless.prepared import NeonAsyncPreparedQuery, NeonPreparedQuery
 
 # monkey patch to force postgres INTERVAL style without ever actually connecting to a database
 # normally in psycopg the style is set in the connection object (via an option or in the connection string)
@@ -34,6 +62,280 @@ from pyserverless.models import (
 # which by default would return b"unknown" and raise an error on conversion
 psycopg_datetime._get_intervalstyle = lambda _: b"postgres"  # noqa: SLF001
 
+# the adapters of every client's transformer, registered once on import. This is a copy of psycopg's global map,
+# so the JSON codec and default adapters set here don't change adapting for psycopg connections in the same process
+_ADAPTERS = AdaptersMap(adapters)
+register_default_adapters(_ADAPTERS)
+set_json_dumps(_json.dumps, _ADAPTERS)
+set_json_loads(_json.loads_value, _ADAPTERS)
+
+
+def _load_timestamptz(value: str) -> datetime:
+    loaded = datetime.fromisoformat(value)
+    # like psycopg without a connection, values are returned in UTC, unless that's out of the datetime range
+    try:
+        return loaded.astimezone(UTC)
+    except OverflowError:
+        return loaded
+
+
+def _load_inet(value: str) -> IPv4Address | IPv6Address | IPv4Interface | IPv6Interface:
+    # postgres writes IPv4 addresses as a dotted quad, which inet_aton packs in C, several times faster than
+    # ipaddress parses it. IPv6 isn't packed, so it, and any invalid value, goes through ipaddress like psycopg
+    address, slash, prefix = value.partition("/")
+    try:
+        packed = inet_aton(address)
+    except OSError:
+        return ip_interface(value) if slash else ip_address(value)
+    return IPv4Interface((packed, int(prefix))) if slash else IPv4Address(packed)
+
+
+def _load_cidr(value: str) -> IPv4Network | IPv6Network:
+    address, _, prefix = value.partition("/")
+    try:
+        packed = inet_aton(address)
+    except OSError:
+        return ip_network(value)
+    return IPv4Network((packed, int(prefix)))
+
+
+# what the default text loaders of common types call, all of these accept the str from the response
+# directly, so values don't need encoding to go through the loader. Text types map to None as their
+# loader only decodes the bytes back to the string we already have (text, varchar, name, ...).
+# Keyed by the registered loader class, so this holds for psycopg's C and Python implementations alike
+_STR_LOADS: dict[type[Loader], Callable[[str], Any] | None] = {
+    loader: load
+    for type_name, load in (
+        ("text", None),
+        ("int4", int),
+        ("float8", float),
+        ("numeric", Decimal),
+        ("bool", "t".__eq__),
+        ("uuid", UUID),
+        # postgres sends dates and times in ISO format, which these parse in C
+        ("date", date.fromisoformat),
+        ("time", time.fromisoformat),
+        ("timestamp", datetime.fromisoformat),
+        ("timestamptz", _load_timestamptz),
+        ("inet", _load_inet),
+        ("cidr", _load_cidr),
+    )
+    if (loader := _ADAPTERS.get_loader(types[type_name].oid, Format.TEXT)) is not None
+}
+
+
+def _dump_bool(value: bool) -> str:  # noqa: FBT001
+    return "t" if value else "f"
+
+
+def _dump_str(value: str) -> str:
+    # the psycopg text dumper rejects NUL characters, which postgres text can't hold
+    if "\x00" in value:
+        raise PostgresAdaptationError(value)
+    return value
+
+
+def _dump_bytes(value: bytes) -> str:
+    return "\\x" + value.hex()
+
+
+def _dump_json(value: dict[Any, Any]) -> str:
+    # the text the jsonb dumper would produce, without looking it up, as its JSON codec is the same
+    try:
+        return _json.dumps(value).decode()
+    except (TypeError, ValueError) as e:
+        # values that aren't JSON serializable, or NaN and infinite floats that JSON can't hold
+        raise PostgresAdaptationError(value) from e
+
+
+# the element loaders of one dimensional arrays of numbers and text, keyed by the registered array loader
+# class, see _flat_array_loader. Like in _STR_LOADS, text elements map to None as they are kept as they are
+_FLAT_ARRAY_LOADS: dict[type[Loader], Callable[[str], Any] | None] = {
+    loader: load
+    for type_name, load in (
+        ("int2", int),
+        ("int4", int),
+        ("int8", int),
+        ("oid", int),
+        ("float4", float),
+        ("float8", float),
+        ("text", None),
+        ("varchar", None),
+        ("bpchar", None),
+        ("name", None),
+    )
+    if (loader := _ADAPTERS.get_loader(types[type_name].array_oid, Format.TEXT)) is not None
+}
+
+
+def _flat_array_loader(
+    load_element: Callable[[str], Any] | None, load_array: Callable[[bytes], Any]
+) -> Callable[[str], Any]:
+    """Return a loader splitting flat arrays of plain elements directly, and leaving any other array to psycopg."""
+
+    def load(value: str) -> Any:
+        if value[0] != "{" or value.find("{", 1) != -1 or "NULL" in value or '"' in value:
+            # nested, with nulls, with explicit bounds like [0:2]={1,2,3}, or with quoted elements, which
+            # postgres writes for any text holding a comma, brace, quote, backslash or whitespace, or empty
+            return load_array(value.encode())
+        if value == "{}":
+            return []
+        # the remaining elements are unquoted, so splitting on commas gives them as they are, several times
+        # faster than psycopg
+        elements = value[1:-1].split(",")
+        return elements if load_element is None else list(map(load_element, elements))
+
+    return load
+
+
+# the bytea loader, see _bytea_loader
+_BYTEA_LOADER = _ADAPTERS.get_loader(types["bytea"].oid, Format.TEXT)
+
+
+def _bytea_loader(load_escaped: Callable[[bytes], bytes]) -> Callable[[str], bytes]:
+    """Return a loader decoding hex bytea values directly, and leaving the escape format to psycopg."""
+
+    def load(value: str) -> bytes:
+        # postgres writes bytea as \x and hex digits, unless bytea_output is set to escape
+        if value.startswith("\\x"):
+            return bytes.fromhex(value[2:])
+        return load_escaped(value.encode())
+
+    return load
+
+
+# common parameter types, keyed by their exact type and converted the same way their psycopg
+# text dumpers would, so they skip the dumper lookup. Subclasses go through psycopg
+_FAST_DUMPS: dict[type, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    bool: _dump_bool,
+    str: _dump_str,
+    bytes: _dump_bytes,
+    dict: _dump_json,
+    date: str,
+    datetime: str,
+    UUID: attrgetter("hex"),
+    IPv4Address: str,
+    IPv6Address: str,
+}
+
+# postgres[ql]://role[:password]@hostname[:port]/database[?options], matched the same way urllib splits a URL:
+# the user info runs up to the last "@" of the authority, and leading slashes before the database are dropped
+_CONNECTION_STRING_PATTERN = re.compile(
+    r"""
+    (?i:postgres(?:ql)?)://
+    [^:/?#]+(?::[^/?#]*)?@
+    (?P<hostname>\[[^\]/?#@]+\]|[^:/?#@\[\]]+)(?::[^/?#@]*)?
+    /+[^/?#]
+    """,
+    re.VERBOSE,
+)
+
+# fetch options that httpx accepts per request, so they can be used with the client's shared connection pool
+# any other option (transport, proxy, verify, ...) only exists at client level and selects which pooled client is used
+_PER_REQUEST_FETCH_OPTIONS = frozenset({"timeout", "auth", "follow_redirects", "extensions"})
+
+# client-level fetch options as sorted (name, value) pairs, used as the key of a pooled client
+_ClientOptions = tuple[tuple[str, Any], ...]
+
+# connection pool limits of the clients, unless set in the fetch options: idle connections are kept for a minute
+# rather than httpx's default 5 seconds, so calls spaced out by a few seconds still find a warm connection
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60)
+
+# HTTP/2 lets concurrent requests share one connection, used when h2 is installed (`pip install pyserverless[http2]`)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _split_fetch_options(fetch_options: Mapping[str, Any]) -> tuple[dict[str, Any], _ClientOptions]:
+    """Split fetch options into per-request options and the client-level options keying a pooled client."""
+    if not fetch_options:
+        return {}, ()
+    request_options = {name: value for name, value in fetch_options.items() if name in _PER_REQUEST_FETCH_OPTIONS}
+    client_options = sorted((name, value) for name, value in fetch_options.items() if name not in request_options)
+    return request_options, tuple(client_options)
+
+
+def _poolable(value: Any) -> bool:
+    """Whether a client-level option value, or the options themselves, can key a pooled client."""
+    # any other value, such as a transport or an SSL context, may be a new object on every call, and would leave
+    # a client open for each of them until close(), so it gets a dedicated client instead
+    if isinstance(value, tuple):
+        return all(map(_poolable, value))
+    return value is None or isinstance(value, str | bytes | int | float)
+
+
+def _client_kwargs(client_options: _ClientOptions) -> dict[str, Any]:
+    """Return the keyword arguments for an httpx client with these client-level options."""
+    kwargs = dict(client_options)
+    kwargs.setdefault("limits", _DEFAULT_LIMITS)
+    if _HTTP2:
+        kwargs.setdefault("http2", True)
+    return kwargs
+
+
+# the most parameters postgres accepts in a single statement
+_MAX_QUERY_PARAMS: Final = 65535
+
+
+def _insert_queries(
+    table: str | tuple[str, ...], columns: Sequence[str], rows: Sequence[Sequence[Any]]
+) -> list[tuple[str, tuple[Any, ...]] | str]:
+    """Build the multi-row INSERT statements for rows, each with as many rows as its parameters allow."""
+    if not columns:
+        msg = "insert_many needs at least one column to insert values into"
+        raise ValueError(msg)
+    table_identifier = sql.Identifier(table) if isinstance(table, str) else sql.Identifier(*table)
+    insert = (
+        sql.SQL("INSERT INTO {} ({}) VALUES ")
+        .format(table_identifier, sql.SQL(", ").join(map(sql.Identifier, columns)))
+        .as_string()
+    )
+    width = len(columns)
+    chunk_size = _MAX_QUERY_PARAMS // width
+    queries: list[tuple[str, tuple[Any, ...]] | str] = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        params: list[Any] = []
+        for index, row in enumerate(chunk, start):
+            # a row of another width would shift every value after it into the wrong column
+            if len(row) != width:
+                msg = f"insert_many row {index} has {len(row)} values, expected one per column ({width})"
+                raise ValueError(msg)
+            params.extend(row)
+        values = ", ".join(
+            "(" + ", ".join(f"${i + 1}" for i in range(offset, offset + width)) + ")"
+            for offset in range(0, len(params), width)
+        )
+        queries.append((insert + values, tuple(params)))
+    return queries
+
+
+# number of array rows converted together, column by column, see _NeonBase._convert_rows
+_ROW_CHUNK_SIZE: Final = 512
+
+
+def _load_column(column: list[Any], load: Callable[[str], Any] | None) -> list[Any]:
+    """Load the values of a column, given the loader of its type from `_NeonBase._get_loader`."""
+    if load is None:
+        return column
+    # without nulls, map keeps the loop in C for builtin loaders like int and float
+    return [None if value is None else load(value) for value in column] if None in column else list(map(load, column))
+
+
+def _check_row_widths(rows: list[list[Any]], width: int) -> None:
+    """Raise if an array row doesn't have one value per field, rather than failing on one of its values."""
+    # one pass in C over the row lengths, the rows themselves are only looked at to report a bad one
+    if rows and set(map(len, rows)) != {width}:
+        row_width = next(len(row) for row in rows if len(row) != width)
+        msg = f"Received a result row with {row_width} values, expected one per field ({width})"
+        raise NeonPyServerlessError(msg)
+
+
+def _prepared_body_prefix(query: str) -> bytes:
+    """Encode the start of a query's request body, up to where its parameters go."""
+    return b'{"query":' + _json.dumps(query) + b',"params":'
+
 
 class _NeonBase:
     """
@@ -62,52 +364,122 @@ class _NeonBase:
             If the connection string is not in the correct format.
 
         """
-        self._url, self._connection_string = self._parse_connection_string(connection_string)
-        register_default_types(types)
-        self._transformer = Transformer()
-        register_default_adapters(self._transformer)
+        api_url, self._connection_string = self._parse_connection_string(connection_string)
+        # parsed once here, rather than by httpx on every request
+        self._url = httpx.URL(api_url)
+        # headers of requests without an auth token by array mode, built once and shared by every request
+        self._base_headers: dict[bool, dict[str, str]] = {
+            array_mode: {
+                "Content-Type": "application/json",
+                "Neon-Connection-String": self._connection_string,
+                "Neon-Raw-Text-Output": "true",
+                "Neon-Array-Mode": "true" if array_mode else "false",
+            }
+            for array_mode in (False, True)
+        }
+        # transaction headers without an auth token, built on first use for each combination of options they use
+        self._transaction_headers: dict[tuple[bool, IsolationLevel, bool, bool], dict[str, str]] = {}
+        self._transformer = Transformer(_ADAPTERS)
+        # bound text loaders by type oid, so converting a cell doesn't go through the transformer lookup
+        # None means the type's text value is already its Python value and is used as is
+        self._loaders: dict[int, Callable[[str], Any] | None] = {}
 
     def _build_headers(self, options: HTTPQueryOptions) -> dict[str, str]:
-        """Build headers for HTTP request."""
-        headers: dict[str, str] = {
-            "Neon-Connection-String": self._connection_string,
-            "Neon-Raw-Text-Output": "true",
-            "Neon-Array-Mode": str(options.array_mode).lower(),
-        }
+        """Build headers for HTTP request. They may be shared with other requests, so they must not be modified."""
+        # columnar results are built from array rows, which avoids a dict per row on the wire
+        return self._add_auth_header(self._base_headers[options.array_mode or options.columnar], options)
+
+    def _build_transaction_headers(self, options: NeonTransactionOptions) -> dict[str, str]:
+        """Build headers for a transaction HTTP request. They may be shared, like the ones of `_build_headers`."""
+        array_mode = options.array_mode or options.columnar
+        key = (array_mode, options.isolation_level, options.read_only, options.deferrable)
+        headers = self._transaction_headers.get(key)
+        if headers is None:
+            headers = self._transaction_headers[key] = {
+                **self._base_headers[array_mode],
+                "Neon-Batch-Isolation-Level": options.isolation_level,
+                "Neon-Batch-Read-Only": "true" if options.read_only else "false",
+                "Neon-Batch-Deferrable": "true" if options.deferrable else "false",
+            }
+        return self._add_auth_header(headers, options)
 
-        if options.auth_token is not None:
-            token = options.auth_token()
-            if not token or not isinstance(token, str):
-                raise InvalidAuthTokenError(token)
-            headers["Authorization"] = f"Bearer {token}"
+    def _add_auth_header(self, headers: dict[str, str], options: HTTPQueryOptions) -> dict[str, str]:
+        """Return the headers with the auth token from the options, if any, without modifying them."""
+        if options.auth_token is None:
+            return headers
 
-        return headers
+        token = options.auth_token()
+        if not token or not isinstance(token, str):
+            raise InvalidAuthTokenError(token)
+        return {**headers, "Authorization": f"Bearer {token}"}
 
     def _python_to_pg(self, param: Any) -> Any:
         """Convert a single Python value to its Postgres representation."""
         if param is None:
             return None
+        dump = _FAST_DUMPS.get(type(param))
+        if dump is not None:
+            return dump(param)
         if isinstance(param, dict):
-            param = Jsonb(param)
+            return _dump_json(param)
         if isinstance(param, bytes):
-            param = "\\x" + param.hex()
+            param = _dump_bytes(param)
 
         try:
             dumper = self._transformer.get_dumper(param, PyFormat.TEXT)
             result = dumper.dump(param)
-            if isinstance(result, bytes):
-                result = result.decode("utf-8")
-        except PsycopgError as e:
+            # the Python dumpers return bytes, and the C ones (psycopg[binary]) bytearray
+            if isinstance(result, bytes | bytearray | memoryview):
+                result = str(result, "utf-8")
+        except (PsycopgError, TypeError, ValueError) as e:
+            # the JSON codec of the Json and Jsonb dumpers raises TypeError and ValueError itself
             raise PostgresAdaptationError(param) from e
         return result
 
+    def _params_to_pg(self, params: Sequence[Any]) -> list[Any]:
+        """Convert query parameters, adapting sequences of only str or only int values in bulk."""
+        param_types = set(map(type, params))
+        # same output as the psycopg text dumpers, which reject NUL characters in strings
+        if param_types == {str} and not any("\x00" in p for p in params):
+            return list(params)
+        if param_types == {int}:
+            return list(map(str, params))
+        return [self._python_to_pg(p) for p in params]
+
+    def _get_loader(self, type_oid: int) -> Callable[[str], Any] | None:
+        """Return a function loading a text value of a type oid, or None if its values need no conversion."""
+        if type_oid in self._loaders:
+            return self._loaders[type_oid]
+        loader = self._transformer.get_loader(type_oid, Format.TEXT)
+        load: Callable[[str], Any] | None
+        if type(loader) in _STR_LOADS:
+            load = _STR_LOADS[type(loader)]
+        elif type(loader) in _FLAT_ARRAY_LOADS:
+            load = _flat_array_loader(_FLAT_ARRAY_LOADS[type(loader)], loader.load)
+        elif type(loader) is _BYTEA_LOADER:
+            load = _bytea_loader(loader.load)
+        elif isinstance(loader, JsonLoader | JsonbLoader):
+            load = loader.loads
+        else:
+            bound_load = loader.load
+
+            def load_encoded(value: str) -> Any:
+                return bound_load(value.encode())
+
+            load = load_encoded
+
+        self._loaders[type_oid] = load
+        return load
+
     def _pg_to_python(self, value: str | None, type_oid: int) -> Any:
         """Convert a single Postgres value to its Python native type."""
         if value is None:
             return None
+        load = self._get_loader(type_oid)
+        if load is None:
+            return value
         try:
-            loader = self._transformer.get_loader(type_oid, Format.TEXT)
-            return loader.load(value.encode())
+            return load(value)
         except (PsycopgError, ValueError) as e:
             raise PythonAdaptationError(value, type_oid) from e
 
@@ -130,6 +502,72 @@ class _NeonBase:
             converted[name] = self._pg_to_python(value, type_oid)
         return converted
 
+    def _convert_rows(self, rows: list[Any], fields: list[dict]) -> list[dict[str, Any]] | list[list[Any]]:
+        """
+        Convert all rows of a result in place, resolving each field's loader once rather than once per cell.
+
+        Decoded rows are replaced as soon as they're converted, so they can be freed
+        before the next ones are built, rather than keeping both results whole at once.
+        """
+        plan = [(field["name"], self._get_loader(field["dataTypeID"])) for field in fields]
+        # index of the first row not converted yet
+        i = 0
+        try:
+            if rows and isinstance(rows[0], list) and plan:
+                # array mode, from arrayMode=true: rows are converted a chunk at a time, column by column, so the
+                # loop over a column's values mostly runs in C, and only the rows of one chunk are alive twice
+                for i in range(0, len(rows), _ROW_CHUNK_SIZE):
+                    chunk = rows[i : i + _ROW_CHUNK_SIZE]
+                    _check_row_widths(chunk, len(plan))
+                    columns = [_load_column([row[j] for row in chunk], load) for j, (_, load) in enumerate(plan)]
+                    rows[i : i + _ROW_CHUNK_SIZE] = map(list, zip(*columns, strict=True))
+            elif rows and isinstance(rows[0], dict):
+                # object mode, from arrayMode=false
+                for i, row in enumerate(rows):
+                    rows[i] = {
+                        name: value if (value := row[name]) is None or load is None else load(value)
+                        for name, load in plan
+                    }
+        except (PsycopgError, ValueError):
+            # go over the rows not converted yet value by value to raise the error for the value that failed
+            for row in rows[i:]:
+                self._convert_row(row, fields)
+            raise
+        return rows
+
+    def _convert_columns(self, rows: list[list[str]], fields: list[dict]) -> dict[str, list[Any]]:
+        """Convert array rows of text format data into Python native columns."""
+        _check_row_widths(rows, len(fields))
+        try:
+            columns = {
+                field["name"]: _load_column([row[i] for row in rows], self._get_loader(field["dataTypeID"]))
+                for i, field in enumerate(fields)
+            }
+        except (PsycopgError, ValueError):
+            # go over the rows value by value to raise the error for the value that failed
+            for row in rows:
+                self._convert_row(row, fields)
+            raise
+        return columns
+
+    def _build_results(self, result: dict[str, Any], options: HTTPQueryOptions) -> FullQueryResults:
+        """Convert a single decoded result to FullQueryResults, in the row layout requested in the options."""
+        fields = result["fields"]
+        # command and field names repeat across results, interning lets them share one string
+        # and makes the field names used as row dict keys compare by identity
+        for field in fields:
+            field["name"] = sys.intern(field["name"])
+        command = result.get("command")
+        # passed through as is if the server sends no command
+        if isinstance(command, str):
+            result["command"] = sys.intern(command)
+
+        if options.columnar:
+            result["rows"] = self._convert_columns(result["rows"], fields)
+        else:
+            result["rows"] = self._convert_rows(result["rows"], fields)
+        return FullQueryResults(**result)
+
     def _parse_connection_string(self, connection_string: str | None = None) -> tuple[str, str]:
         """Parse and validate a PostgreSQL connection string."""
         if connection_string is None:
@@ -137,20 +575,11 @@ class _NeonBase:
         if connection_string is None:
             raise ConnectionStringMissingError
 
-        parsed = urlparse(connection_string)
-        if (
-            parsed.scheme not in ("postgresql", "postgres")
-            or not parsed.username
-            or not parsed.hostname
-            or not parsed.path
-        ):
-            raise ConnectionStringFormattingError(connection_string)
-
-        pathname = parsed.path.lstrip("/")
-        if not pathname:
+        match = _CONNECTION_STRING_PATTERN.match(connection_string)
+        if match is None:
             raise ConnectionStringFormattingError(connection_string)
 
-        api_url = f"https://{parsed.hostname}/sql"
+        api_url = f"https://{match['hostname'].lower()}/sql"
         return api_url, connection_string
 
     def _process_query_response(
@@ -161,8 +590,7 @@ class _NeonBase:
         query_options: HTTPQueryOptions,
     ) -> FullQueryResults | QueryRows:
         """Process query response and convert rows to Python types."""
-        json_response["rows"] = [self._convert_row(row, json_response["fields"]) for row in json_response["rows"]]
-        results = FullQueryResults(**json_response)
+        results = self._build_results(json_response, query_options)
 
         if query_options.result_callback is not None:
             query_options.result_callback(
@@ -186,8 +614,7 @@ class _NeonBase:
         converted_results = []
 
         for result in results:
-            result["rows"] = [self._convert_row(row, result["fields"]) for row in result["rows"]]
-            converted_result = FullQueryResults(**result)
+            converted_result = self._build_results(result, transaction_options)
             converted_results.append(converted_result if transaction_options.full_results else converted_result.rows)
 
         return converted_results
@@ -285,6 +712,59 @@ class Neon(_NeonBase):
 
         """
         super().__init__(connection_string)
+        self._clients: dict[_ClientOptions, httpx.Client] = {}
+
+    def __enter__(self) -> Self:
+        """Enter the client context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the underlying HTTP clients."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP clients and release their pooled connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    def _get_client(self, client_options: _ClientOptions) -> httpx.Client | None:
+        """Return the pooled client for these client options, or None if they need a dedicated client."""
+        if not _poolable(client_options):
+            return None
+        client = self._clients.get(client_options)
+        if client is None:
+            created = httpx.Client(**_client_kwargs(client_options))
+            # another thread may have pooled a client for these options meanwhile, the one that lost is closed
+            client = self._clients.setdefault(client_options, created)
+            if client is not created:
+                created.close()
+        return client
+
+    def _post(self, body: dict[str, Any] | bytes, headers: dict[str, str], options: HTTPQueryOptions) -> Any:
+        """Send a request to the SQL endpoint on the pooled client matching the fetch options, and decode the reply."""
+        request_options, client_options = _split_fetch_options(options.fetch_options)
+        # prepared queries pass their body already encoded
+        content = body if isinstance(body, bytes) else _json.dumps(body)
+        try:
+            client = self._get_client(client_options)
+            if client is not None:
+                response = client.post(self._url, content=content, headers=headers, **request_options)
+            else:
+                with httpx.Client(**_client_kwargs(client_options)) as dedicated_client:
+                    response = dedicated_client.post(self._url, content=content, headers=headers, **request_options)
+        except httpx.RequestError as e:
+            raise NeonHTTPClientError from e
+
+        if response.status_code != httpx.codes.OK:
+            raise NeonHTTPResponseError(response.status_code, response.content)
+        # only the decoded body is returned, so the raw bytes can be freed before its rows are converted
+        return _json.loads(response.content)
 
     def query(
         self,
@@ -323,7 +803,7 @@ class Neon(_NeonBase):
         params = params or ()
         query_options = query_options or HTTPQueryOptions()
 
-        processed_params = [self._python_to_pg(p) for p in params]
+        processed_params = self._params_to_pg(params)
         if query_options.query_callback is not None:
             query_options.query_callback(query, processed_params)
 
@@ -333,21 +813,7 @@ class Neon(_NeonBase):
         }
 
         headers = self._build_headers(query_options)
-
-        try:
-            with httpx.Client(**query_options.fetch_options) as client:
-                response = client.post(
-                    self._url,
-                    json=body,
-                    headers=headers,
-                )
-        except httpx.RequestError as e:
-            raise NeonHTTPClientError from e
-
-        if response.status_code != httpx.codes.OK:
-            raise NeonHTTPResponseError(response.status_code, response.text)
-
-        json_response = response.json()
+        json_response = self._post(body, headers, query_options)
         return self._process_query_response(json_response, query, processed_params, query_options)
 
     def transaction(
@@ -392,36 +858,115 @@ class Neon(_NeonBase):
         processed_queries = [
             {
                 "query": query,
-                "params": [self._python_to_pg(p) for p in params],
+                "params": self._params_to_pg(params),
             }
             for query, params in queries
         ]
         body = {"queries": processed_queries}
 
-        headers = self._build_headers(transaction_options)
-        headers.update(
-            {
-                "Neon-Batch-Isolation-Level": transaction_options.isolation_level.value,
-                "Neon-Batch-Read-Only": str(transaction_options.read_only).lower(),
-                "Neon-Batch-Deferrable": str(transaction_options.deferrable).lower(),
-            }
-        )
+        headers = self._build_transaction_headers(transaction_options)
 
-        try:
-            with httpx.Client(**transaction_options.fetch_options) as client:
-                response = client.post(
-                    self._url,
-                    json=body,
-                    headers=headers,
-                )
-        except httpx.RequestError as e:
-            raise NeonHTTPClientError from e
+        results = self._post(body, headers, transaction_options)["results"]
+        return self._process_transaction_response(results, transaction_options)
 
-        if response.status_code != httpx.codes.OK:
-            raise NeonHTTPResponseError(response.status_code, response.text)
+    def pipeline(self, transaction_options: NeonTransactionOptions | None = None) -> NeonPipeline:
+        """
+        Create a pipeline that sends queued queries in a single request.
 
-        results = response.json()["results"]
-        return self._process_transaction_response(results, transaction_options)
+        Parameters
+        ----------
+        transaction_options : NeonTransactionOptions, optional
+            transaction options used when the pipeline is flushed.
+
+        Returns
+        -------
+        NeonPipeline
+            A context manager that runs the queued queries as one transaction on exit.
+
+        """
+        return NeonPipeline(self, transaction_options)
+
+    def insert_many(
+        self,
+        table: str | tuple[str, ...],
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        transaction_options: NeonTransactionOptions | None = None,
+    ) -> int:
+        """
+        Insert many rows into a table in a single transaction.
+
+        The rows are sent as multi-row `INSERT ... VALUES` statements, each holding as many
+        rows as fit in postgres' limit of 65535 parameters, rather than one statement per row.
+        Since the statements have no `RETURNING` clause, only the number of inserted rows is returned.
+
+        Parameters
+        ----------
+        table : str | tuple[str, ...]
+            The table to insert into, or a (schema, table) tuple for a schema-qualified table.
+        columns : Sequence[str]
+            The columns the values of each row are inserted into.
+        rows : Sequence[Sequence[Any]]
+            The rows to insert, each with one value per column.
+        transaction_options : NeonTransactionOptions, optional
+            transaction options.
+
+        Returns
+        -------
+        int
+            The number of inserted rows.
+
+        Raises
+        ------
+        NeonHTTPResponseError
+            If the HTTP request fails.
+        InvalidAuthTokenError
+            If the authentication token is invalid.
+        ValueError
+            If no columns are given, or a row doesn't have one value per column.
+        ParameterAdaptationError
+            If a value cannot be adapted to a PostgreSQL type.
+
+        """
+        queries = _insert_queries(table, columns, rows)
+        if not queries:
+            return 0
+        transaction_options = replace(transaction_options or NeonTransactionOptions(), full_results=True)
+        results = self.transaction(queries, transaction_options)
+        return sum(result.rowCount for result in results if isinstance(result, FullQueryResults))
+
+    def prepare(self, query: str, query_options: HTTPQueryOptions | None = None) -> NeonPreparedQuery:
+        """
+        Prepare a query to be executed repeatedly with different parameters.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to execute, using $1, $2, etc., for parameters.
+        query_options : HTTPQueryOptions | None, optional
+            Query options, used for every execution.
+
+        Returns
+        -------
+        NeonPreparedQuery
+            A callable that executes the query with its arguments as parameters, like `query` would.
+
+        """
+        query_options = query_options or HTTPQueryOptions()
+        body_prefix = _prepared_body_prefix(query)
+        # the auth token callback may return a new token on every call, so only reuse headers without one
+        headers = self._build_headers(query_options) if query_options.auth_token is None else None
+
+        def execute(params: tuple[Any, ...]) -> FullQueryResults | QueryRows:
+            processed_params = self._params_to_pg(params)
+            if query_options.query_callback is not None:
+                query_options.query_callback(query, processed_params)
+
+            body = body_prefix + _json.dumps(processed_params) + b"}"
+            json_response = self._post(body, headers or self._build_headers(query_options), query_options)
+            return self._process_query_response(json_response, query, processed_params, query_options)
+
+        return NeonPreparedQuery(query, execute)
 
 
 class NeonAsync(_NeonBase):
@@ -494,6 +1039,16 @@ class NeonAsync(_NeonBase):
     ...     ("SELECT * FROM orders LIMIT 5 WHERE user_id = $1", (42,)),
     ... ], transaction_options=options)
 
+    ### Running Queries Concurrently ###
+
+    Calls made from the same client share its connection pool, so independent
+    queries can be awaited together:
+
+    >>> users, orders = await asyncio.gather(
+    ...     neon.query("SELECT * FROM users WHERE id = $1", (42,)),
+    ...     neon.query("SELECT * FROM orders WHERE user_id = $1", (42,)),
+    ... )
+
     """
 
     def __init__(self, connection_string: str | None = None) -> None:
@@ -516,6 +1071,70 @@ class NeonAsync(_NeonBase):
 
         """
         super().__init__(connection_string)
+        # pooled clients of each event loop, as a client's connections can only be used in the loop that opened them
+        self._clients: dict[asyncio.AbstractEventLoop, dict[_ClientOptions, httpx.AsyncClient]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the underlying HTTP clients."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients and release their pooled connections."""
+        clients_by_loop, self._clients = self._clients, {}
+        # clients of other event loops can't be closed from this one, they are dropped with their loop
+        for client in clients_by_loop.get(asyncio.get_running_loop(), {}).values():
+            await client.aclose()
+
+    def _get_client(self, client_options: _ClientOptions) -> httpx.AsyncClient | None:
+        """Return the running loop's pooled client for these client options, or None if they need a dedicated client."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            # first request in this loop, e.g. from a new asyncio.run() reusing a module-level client. The clients
+            # of loops that have since been closed can't send anything anymore, so they are dropped. Other threads
+            # may run their own loops, so the mapping is updated in place rather than replaced
+            for other in list(self._clients):
+                if other.is_closed():
+                    self._clients.pop(other, None)
+            clients = self._clients.setdefault(loop, {})
+        if not _poolable(client_options):
+            return None
+        client = clients.get(client_options)
+        if client is None:
+            # a loop's clients are only used from its own thread, and nothing is awaited here, so no race
+            client = clients[client_options] = httpx.AsyncClient(**_client_kwargs(client_options))
+        return client
+
+    async def _post(self, body: dict[str, Any] | bytes, headers: dict[str, str], options: HTTPQueryOptions) -> Any:
+        """Send a request to the SQL endpoint on the pooled client matching the fetch options, and decode the reply."""
+        request_options, client_options = _split_fetch_options(options.fetch_options)
+        # prepared queries pass their body already encoded
+        content = body if isinstance(body, bytes) else _json.dumps(body)
+        try:
+            client = self._get_client(client_options)
+            if client is not None:
+                response = await client.post(self._url, content=content, headers=headers, **request_options)
+            else:
+                async with httpx.AsyncClient(**_client_kwargs(client_options)) as dedicated_client:
+                    response = await dedicated_client.post(
+                        self._url, content=content, headers=headers, **request_options
+                    )
+        except httpx.RequestError as e:
+            raise NeonHTTPClientError from e
+
+        if response.status_code != httpx.codes.OK:
+            raise NeonHTTPResponseError(response.status_code, response.content)
+        # only the decoded body is returned, so the raw bytes can be freed before its rows are converted
+        return _json.loads(response.content)
 
     async def query(
         self,
@@ -554,7 +1173,7 @@ class NeonAsync(_NeonBase):
         params = params or ()
         query_options = query_options or HTTPQueryOptions()
 
-        processed_params = [self._python_to_pg(p) for p in params]
+        processed_params = self._params_to_pg(params)
         if query_options.query_callback is not None:
             query_options.query_callback(query, processed_params)
 
@@ -564,22 +1183,57 @@ class NeonAsync(_NeonBase):
         }
 
         headers = self._build_headers(query_options)
+        json_response = await self._post(body, headers, query_options)
+        return self._process_query_response(json_response, query, processed_params, query_options)
 
-        try:
-            async with httpx.AsyncClient(**query_options.fetch_options) as client:
-                response = await client.post(
-                    self._url,
-                    json=body,
-                    headers=headers,
-                )
-        except httpx.RequestError as e:
-            raise NeonHTTPClientError from e
+    async def query_many(
+        self,
+        queries: list[tuple[str, tuple[Any, ...]] | str],
+        query_options: HTTPQueryOptions | None = None,
+        max_concurrency: int = 20,
+    ) -> list[FullQueryResults | QueryRows]:
+        """
+        Execute independent queries concurrently, each in its own request.
 
-        if response.status_code != httpx.codes.OK:
-            raise NeonHTTPResponseError(response.status_code, response.text)
+        Unlike `transaction`, the queries are not atomic and may run in any order,
+        but their round-trips overlap instead of running one after another.
 
-        json_response = response.json()
-        return self._process_query_response(json_response, query, processed_params, query_options)
+        Parameters
+        ----------
+        queries : list[tuple[str, tuple[Any, ...]] | str]
+            A list of queries to execute. Each element can either be:
+            - A tuple (query, params), where params is a tuple of values to substitute
+                into the query.
+            - A plain query string (equivalent to (query, ())), if no parameters are needed.
+        query_options : HTTPQueryOptions | None, optional
+            Query options, applied to every query.
+        max_concurrency : int, default=20
+            Maximum number of requests in flight at once. Stays within the client's
+            default of 32 keep-alive connections, so they can all be reused.
+
+        Returns
+        -------
+        list[FullQueryResults | QueryRows]
+            One result per query, in the same order as `queries`.
+
+        Raises
+        ------
+        NeonHTTPResponseError
+            If any of the HTTP requests fail.
+        InvalidAuthTokenError
+            If the authentication token is invalid.
+        ParameterAdaptationError
+            If parameters cannot be adapted from Python types to PostgreSQL types.
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item: tuple[str, tuple[Any, ...]] | str) -> FullQueryResults | QueryRows:
+            query, params = (item, ()) if isinstance(item, str) else item
+            async with semaphore:
+                return await self.query(query, params, query_options)
+
+        return await asyncio.gather(*(run(item) for item in queries))
 
     async def transaction(
         self,
@@ -623,33 +1277,138 @@ class NeonAsync(_NeonBase):
         processed_queries = [
             {
                 "query": query,
-                "params": [self._python_to_pg(p) for p in params],
+                "params": self._params_to_pg(params),
             }
             for query, params in queries
         ]
         body = {"queries": processed_queries}
 
-        headers = self._build_headers(transaction_options)
-        headers.update(
-            {
-                "Neon-Batch-Isolation-Level": transaction_options.isolation_level.value,
-                "Neon-Batch-Read-Only": str(transaction_options.read_only).lower(),
-                "Neon-Batch-Deferrable": str(transaction_options.deferrable).lower(),
-            }
-        )
+        headers = self._build_transaction_headers(transaction_options)
 
-        try:
-            async with httpx.AsyncClient(**transaction_options.fetch_options) as client:
-                response = await client.post(
-                    self._url,
-                    json=body,
-                    headers=headers,
-                )
-        except httpx.RequestError as e:
-            raise NeonHTTPClientError from e
+        results = (await self._post(body, headers, transaction_options))["results"]
+        return self._process_transaction_response(results, transaction_options)
 
-        if response.status_code != httpx.codes.OK:
-            raise NeonHTTPResponseError(response.status_code, response.text)
+    def pipeline(self, transaction_options: NeonTransactionOptions | None = None) -> NeonAsyncPipeline:
+        """
+        Create a pipeline that sends queued queries in a single request.
 
-        results = response.json()["results"]
-        return self._process_transaction_response(results, transaction_options)
+        Parameters
+        ----------
+        transaction_options : NeonTransactionOptions, optional
+            transaction options used when the pipeline is flushed.
+
+        Returns
+        -------
+        NeonAsyncPipeline
+            An async context manager that runs the queued queries as one transaction on exit.
+
+        """
+        return NeonAsyncPipeline(self, transaction_options)
+
+    async def insert_many(
+        self,
+        table: str | tuple[str, ...],
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        transaction_options: NeonTransactionOptions | None = None,
+    ) -> int:
+        """
+        Insert many rows into a table in a single transaction.
+
+        The rows are sent as multi-row `INSERT ... VALUES` statements, each holding as many
+        rows as fit in postgres' limit of 65535 parameters, rather than one statement per row.
+        Since the statements have no `RETURNING` clause, only the number of inserted rows is returned.
+
+        Parameters
+        ----------
+        table : str | tuple[str, ...]
+            The table to insert into, or a (schema, table) tuple for a schema-qualified table.
+        columns : Sequence[str]
+            The columns the values of each row are inserted into.
+        rows : Sequence[Sequence[Any]]
+            The rows to insert, each with one value per column.
+        transaction_options : NeonTransactionOptions, optional
+            transaction options.
+
+        Returns
+        -------
+        int
+            The number of inserted rows.
+
+        Raises
+        ------
+        NeonHTTPResponseError
+            If the HTTP request fails.
+        InvalidAuthTokenError
+            If the authentication token is invalid.
+        ValueError
+            If no columns are given, or a row doesn't have one value per column.
+        ParameterAdaptationError
+            If a value cannot be adapted to a PostgreSQL type.
+
+        """
+        queries = _insert_queries(table, columns, rows)
+        if not queries:
+            return 0
+        transaction_options = replace(transaction_options or NeonTransactionOptions(), full_results=True)
+        results = await self.transaction(queries, transaction_options)
+        return sum(result.rowCount for result in results if isinstance(result, FullQueryResults))
+
+    def prepare(self, query: str, query_options: HTTPQueryOptions | None = None) -> NeonAsyncPreparedQuery:
+        """
+        Prepare a query to be executed repeatedly with different parameters.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to execute, using $1, $2, etc., for parameters.
+        query_options : HTTPQueryOptions | None, optional
+            Query options, used for every execution.
+
+        Returns
+        -------
+        NeonAsyncPreparedQuery
+            An async callable that executes the query with its arguments as parameters, like `query` would.
+
+        """
+        query_options = query_options or HTTPQueryOptions()
+        body_prefix = _prepared_body_prefix(query)
+        # the auth token callback may return a new token on every call, so only reuse headers without one
+        headers = self._build_headers(query_options) if query_options.auth_token is None else None
+
+        async def execute(params: tuple[Any, ...]) -> FullQueryResults | QueryRows:
+            processed_params = self._params_to_pg(params)
+            if query_options.query_callback is not None:
+                query_options.query_callback(query, processed_params)
+
+            body = body_prefix + _json.dumps(processed_params) + b"}"
+            json_response = await self._post(body, headers or self._build_headers(query_options), query_options)
+            return self._process_query_response(json_response, query, processed_params, query_options)
+
+        return NeonAsyncPreparedQuery(query, execute)
+
+    def batched(
+        self,
+        transaction_options: NeonTransactionOptions | None = None,
+        window_ms: float = 5.0,
+        max_batch: int = 16,
+    ) -> NeonAsyncBatcher:
+        """
+        Create a batcher that coalesces concurrent queries into single requests.
+
+        Parameters
+        ----------
+        transaction_options : NeonTransactionOptions, optional
+            transaction options used to send each batch.
+        window_ms : float, default=5.0
+            How long to wait for more queries after the first one of a batch, in milliseconds.
+        max_batch : int, default=16
+            Number of queries that sends a batch right away.
+
+        Returns
+        -------
+        NeonAsyncBatcher
+            A batcher whose `query` method is awaited like `NeonAsync.query`.
+
+        """
+        return NeonAsyncBatcher(self, transaction_options, window_ms, max_batch)
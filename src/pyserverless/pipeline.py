@@ -0,0 +1,272 @@
+"""Pipelines that batch queries into a single HTTP round-trip."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from pyserverless.errors import NeonHTTPResponseError, PostgresAdaptationError
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from pyserverless.models import FullQueryResults, NeonTransactionOptions, QueryRows
+    from pyserverless.neon import Neon, NeonAsync
+
+
+def _failed_uncommitted(exc: Exception) -> bool:
+    """
+    Whether a batch failed on one of its queries without anything being committed.
+
+    Parameters that can't be adapted fail before the request is sent, and Postgres rejects a statement
+    with a 4xx response, rolling back the batch. Any other failure, such as a 5xx response or result rows
+    that can't be converted, may come after the batch was committed, so its queries must not run again.
+    """
+    if isinstance(exc, PostgresAdaptationError):
+        return True
+    return (
+        isinstance(exc, NeonHTTPResponseError)
+        and httpx.codes.BAD_REQUEST <= exc.status_code < httpx.codes.INTERNAL_SERVER_ERROR
+    )
+
+
+class _PipelineBase:
+    """
+    Base class for query pipelines.
+
+    Holds the queued queries and the results of the last flush.
+    """
+
+    def __init__(self, transaction_options: NeonTransactionOptions | None = None) -> None:
+        self._transaction_options = transaction_options
+        self._queries: list[tuple[str, tuple[Any, ...]] | str] = []
+        self.results: list[FullQueryResults] | list[QueryRows] = []
+
+    def query(self, query: str, params: tuple[Any, ...] | None = None) -> int:
+        """
+        Queue a query to be sent with the rest of the pipeline.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to execute, using $1, $2, etc., for parameters.
+        params : tuple[Any, ...] | None, optional
+            Tuple of parameters to substitute into the query.
+
+        Returns
+        -------
+        int
+            Index of this query's result in `results` once the pipeline is flushed.
+
+        """
+        self._queries.append((query, params or ()))
+        return len(self._queries) - 1
+
+    def _take_queries(self) -> list[tuple[str, tuple[Any, ...]] | str]:
+        """Return the queued queries and reset the queue."""
+        queries, self._queries = self._queries, []
+        return queries
+
+
+class NeonPipeline(_PipelineBase):
+    """
+    Sync pipeline that sends all queued queries as one transaction.
+
+    Queries are sent when the context manager exits without an exception,
+    or when `execute` is called. Since they run in a single transaction,
+    a failing query rolls back the whole batch.
+
+    Examples
+    --------
+    >>> with neon.pipeline() as pipe:
+    ...     pipe.query("INSERT INTO users (name) VALUES ($1)", ("Alice",))
+    ...     pipe.query("INSERT INTO users (name) VALUES ($1)", ("Bob",))
+    ...     count = pipe.query("SELECT COUNT(*) FROM users")
+    >>> print(pipe.results[count])
+
+    """
+
+    def __init__(self, neon: Neon, transaction_options: NeonTransactionOptions | None = None) -> None:
+        super().__init__(transaction_options)
+        self._neon = neon
+
+    def execute(self) -> list[FullQueryResults] | list[QueryRows]:
+        """
+        Send the queued queries in a single request.
+
+        Returns
+        -------
+        list[FullQueryResults] | list[QueryRows]
+            One result per queued query, in the order they were queued.
+
+        """
+        queries = self._take_queries()
+        self.results = self._neon.transaction(queries, self._transaction_options) if queries else []
+        return self.results
+
+    def __enter__(self) -> Self:
+        """Enter the pipeline context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Send the queued queries unless the block raised."""
+        if exc_type is None:
+            self.execute()
+
+
+class NeonAsyncPipeline(_PipelineBase):
+    """
+    Async pipeline that sends all queued queries as one transaction.
+
+    Queries are sent when the context manager exits without an exception,
+    or when `execute` is awaited. Since they run in a single transaction,
+    a failing query rolls back the whole batch.
+
+    Examples
+    --------
+    >>> async with neon.pipeline() as pipe:
+    ...     pipe.query("INSERT INTO users (name) VALUES ($1)", ("Alice",))
+    ...     pipe.query("INSERT INTO users (name) VALUES ($1)", ("Bob",))
+    ...     count = pipe.query("SELECT COUNT(*) FROM users")
+    >>> print(pipe.results[count])
+
+    """
+
+    def __init__(self, neon: NeonAsync, transaction_options: NeonTransactionOptions | None = None) -> None:
+        super().__init__(transaction_options)
+        self._neon = neon
+
+    async def execute(self) -> list[FullQueryResults] | list[QueryRows]:
+        """
+        Send the queued queries in a single request.
+
+        Returns
+        -------
+        list[FullQueryResults] | list[QueryRows]
+            One result per queued query, in the order they were queued.
+
+        """
+        queries = self._take_queries()
+        self.results = await self._neon.transaction(queries, self._transaction_options) if queries else []
+        return self.results
+
+    async def __aenter__(self) -> Self:
+        """Enter the pipeline context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Send the queued queries unless the block raised."""
+        if exc_type is None:
+            await self.execute()
+
+
+class NeonAsyncBatcher:
+    """
+    Batcher that coalesces independent async queries into a single HTTP request.
+
+    Queries awaited within `window_ms` of the first one, up to `max_batch` of them,
+    are sent together as one transaction. Each caller gets its own query's result.
+    If Postgres rejects a query of the batch, or a parameter can't be adapted, nothing
+    was committed and the queries are retried one by one, so a failing query only fails
+    its own caller. Any other error, which may come after the batch was committed, fails
+    every caller of the batch without running its queries again.
+
+    Examples
+    --------
+    >>> batcher = neon.batched()
+    >>> user, orders = await asyncio.gather(
+    ...     batcher.query("SELECT * FROM users WHERE id = $1", (42,)),
+    ...     batcher.query("SELECT * FROM orders WHERE user_id = $1", (42,)),
+    ... )
+
+    """
+
+    def __init__(
+        self,
+        neon: NeonAsync,
+        transaction_options: NeonTransactionOptions | None = None,
+        window_ms: float = 5.0,
+        max_batch: int = 16,
+    ) -> None:
+        self._neon = neon
+        self._transaction_options = transaction_options
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._pending: list[tuple[tuple[str, tuple[Any, ...]], asyncio.Future[Any]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # keeps a reference to in-flight batches so they aren't garbage collected
+        self._sending: set[asyncio.Task[None]] = set()
+
+    async def query(self, query: str, params: tuple[Any, ...] | None = None) -> FullQueryResults | QueryRows:
+        """
+        Execute a query as part of the next batch.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to execute, using $1, $2, etc., for parameters.
+        params : tuple[Any, ...] | None, optional
+            Tuple of parameters to substitute into the query.
+
+        Returns
+        -------
+        FullQueryResults | QueryRows
+            The result of this query, as `NeonAsync.query` would return it.
+
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((query, params or ()), future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending queries as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(pending))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, pending: list[tuple[tuple[str, tuple[Any, ...]], asyncio.Future[Any]]]) -> None:
+        """Run a batch and hand each query's result, or error, to its caller."""
+        try:
+            results = await self._neon.transaction([query for query, _ in pending], self._transaction_options)
+        except Exception as e:  # noqa: BLE001 - handed to every caller awaiting the batch
+            if len(pending) > 1 and _failed_uncommitted(e):
+                # nothing was committed, run the queries on their own so only the failing one errors
+                await asyncio.gather(*(self._send([item]) for item in pending))
+                return
+            for _, future in pending:
+                _set_exception(future, e)
+        else:
+            for (_, future), result in zip(pending, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # if the batch itself was cancelled, don't leave its callers waiting
+            for _, future in pending:
+                future.cancel()
+
+
+def _set_exception(future: asyncio.Future[Any], exc: BaseException) -> None:
+    """Fail a caller's future, unless the caller already gave up on it."""
+    if not future.done():
+        future.set_exception(exc)
@@ -0,0 +1,86 @@
+"""Prepared queries that reuse the parts of a request that don't depend on the parameters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pyserverless.models import FullQueryResults, QueryRows
+
+
+class NeonPreparedQuery:
+    """
+    Sync query whose request is prepared once and sent with new parameters on every call.
+
+    The query's JSON encoding and the request headers are built when the query is
+    prepared, so each call only converts and encodes its parameters.
+
+    Examples
+    --------
+    >>> get_user = neon.prepare("SELECT * FROM users WHERE id = $1")
+    >>> alice = get_user(1)
+    >>> bob = get_user(2)
+
+    """
+
+    def __init__(self, query: str, execute: Callable[[tuple[Any, ...]], FullQueryResults | QueryRows]) -> None:
+        self.query = query
+        self._execute = execute
+
+    def __call__(self, *params: Any) -> FullQueryResults | QueryRows:
+        """
+        Execute the query with these parameters.
+
+        Parameters
+        ----------
+        *params : Any
+            Parameters to substitute into the query, in the order of $1, $2, etc.
+
+        Returns
+        -------
+        FullQueryResults | QueryRows
+            The result of the query, as `Neon.query` would return it.
+
+        """
+        return self._execute(params)
+
+
+class NeonAsyncPreparedQuery:
+    """
+    Async query whose request is prepared once and sent with new parameters on every call.
+
+    The query's JSON encoding and the request headers are built when the query is
+    prepared, so each call only converts and encodes its parameters.
+
+    Examples
+    --------
+    >>> get_user = neon.prepare("SELECT * FROM users WHERE id = $1")
+    >>> alice = await get_user(1)
+    >>> bob = await get_user(2)
+
+    """
+
+    def __init__(
+        self, query: str, execute: Callable[[tuple[Any, ...]], Awaitable[FullQueryResults | QueryRows]]
+    ) -> None:
+        self.query = query
+        self._execute = execute
+
+    async def __call__(self, *params: Any) -> FullQueryResults | QueryRows:
+        """
+        Execute the query with these parameters.
+
+        Parameters
+        ----------
+        *params : Any
+            Parameters to substitute into the query, in the order of $1, $2, etc.
+
+        Returns
+        -------
+        FullQueryResults | QueryRows
+            The result of the query, as `NeonAsync.query` would return it.
+
+        """
+        return await self._execute(params)
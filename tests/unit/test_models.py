@@ -1,7 +1,9 @@
+import typing
+
 import pytest
 
 from pyserverless.errors import TransactionConfigurationError
-from pyserverless.models import IsolationLevel, NeonTransactionOptions
+from pyserverless.models import HTTPQueryOptions, IsolationLevel, NeonTransactionOptions
 
 
 class TestNeonTransactionOptions:
@@ -17,3 +19,34 @@ class TestNeonTransactionOptions:
         """Test that invalid deferrable configurations raise appropriate errors."""
         with pytest.raises(TransactionConfigurationError):
             NeonTransactionOptions(isolation_level=isolation_level, read_only=read_only, deferrable=True)
+
+    @pytest.mark.parametrize("isolation_level", [IsolationLevel.SERIALIZABLE, "Serializable"])
+    def test_valid_deferrable_configuration(self, isolation_level):
+        """Test that a deferrable read only transaction accepts the serializable level, as a member or its string."""
+        options = NeonTransactionOptions(isolation_level=isolation_level, read_only=True, deferrable=True)
+        assert options.isolation_level == IsolationLevel.SERIALIZABLE
+
+
+class TestHTTPQueryOptions:
+    def test_default_fetch_options_shared_and_read_only(self):
+        """Test that the default fetch options are a shared, immutable mapping."""
+        first, second = HTTPQueryOptions(), HTTPQueryOptions()
+        assert first.fetch_options is second.fetch_options
+        assert dict(first.fetch_options) == {}
+        with pytest.raises(TypeError):
+            first.fetch_options["timeout"] = 1.0
+
+    @pytest.mark.parametrize("options_type", [HTTPQueryOptions, NeonTransactionOptions])
+    def test_type_hints_resolve(self, options_type):
+        """Test that the option annotations can be resolved at runtime."""
+        hints = typing.get_type_hints(options_type)
+        assert "fetch_options" in hints
+        assert "result_callback" in hints
+
+
+class TestIsolationLevel:
+    def test_members_are_wire_strings(self):
+        """Test that isolation levels can be used directly as header values."""
+        assert isinstance(IsolationLevel.SERIALIZABLE, str)
+        assert IsolationLevel.SERIALIZABLE == "Serializable"
+        assert f"{IsolationLevel.READ_COMMITTED}" == "ReadCommitted"